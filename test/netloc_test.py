@@ -17,6 +17,20 @@ class NetlocTest(unittest.TestCase):
         netloc = 'zack:1234@github.com:443'
         assert hash(Netloc(netloc)) == hash(netloc)
 
+    def test_components_are_only_parsed_once(self):
+        netloc = Netloc('zack:1234@github.com:443')
+        assert netloc.hostname is netloc.hostname
+        assert netloc.username is netloc.username
+        assert Netloc('zack:1234@github.com:443').hostname is netloc.hostname
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(Netloc('github.com'), '__dict__')
+
+    def test_invalid_port_only_raises_for_port(self):
+        netloc = Netloc('github.com:http')
+        assert netloc.hostname == 'github.com'
+        assert_raises(ValueError, lambda: netloc.port)
+
     def test_username(self):
         assert Netloc('github.com').username is None
         assert Netloc('zack@github.com').username == 'zack'
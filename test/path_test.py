@@ -2,8 +2,13 @@
 
 import unittest
 
-from urlblocks.path import URLPath
-from urlblocks.six import u
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
+from urlblocks.path import URLPath, path_encode
+from urlblocks.six import PY3, u
 
 
 class URLPathTest(unittest.TestCase):
@@ -95,5 +100,19 @@ class URLPathTest(unittest.TestCase):
     def test_add_encodes_non_ascii_and_reserved_characters(self):
         assert URLPath('/a/b/c').add(u('d /\N{LATIN SMALL LETTER E WITH ACUTE}')) == '/a/b/c/d%20/%C3%A9'
 
+    def test_add_encodes_ascii_special_characters(self):
+        assert URLPath('/a/b/c').add('d e/"f"%') == '/a/b/c/d%20e/%22f%22%25'
+
     def test_add_does_not_encode_slash_characters(self):
         assert URLPath('/a/b/c').add('d/e') == '/a/b/c/d/e'
+
+    def test_path_encode_agrees_with_quote(self):
+        for s in ['abc', '~a b', 'a~b', '/a/~b/', u('~\N{LATIN SMALL LETTER E WITH ACUTE} ~')]:
+            for safe in ['', '/', b'/']:
+                expected = quote(s.encode('utf-8'), safe=safe)
+                assert path_encode(s, safe=safe) == expected
+        if PY3:
+            # quote() ignores non-ASCII characters in ``safe``.
+            s = u('/\N{LATIN SMALL LETTER E WITH ACUTE} a')
+            for safe in [u('/\N{LATIN SMALL LETTER E WITH ACUTE}'), u('/\N{LATIN SMALL LETTER E WITH ACUTE}').encode('utf-8')]:
+                assert path_encode(s, safe=safe) == quote(s, safe=safe)
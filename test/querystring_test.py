@@ -2,8 +2,13 @@
 
 import unittest
 
-from urlblocks.query_string import QueryString
-from urlblocks.six import u
+try:
+    from urllib import quote_plus
+except ImportError:
+    from urllib.parse import quote_plus
+
+from urlblocks.query_string import QueryString, qs_encode
+from urlblocks.six import PY3, u
 
 
 class QueryStringTest(unittest.TestCase):
@@ -177,3 +182,10 @@ class QueryStringTest(unittest.TestCase):
     def test_del_params_accepts_an_iterable_and_removes_all_listed_parameters(self):
         s = QueryString('abc=123&def=456&xyz=789')
         assert s.del_params(('abc', 'xyz')) == 'def=456'
+
+    def test_qs_encode_agrees_with_quote_plus(self):
+        for s in ['abc', '~', 'a~b', 'a b&c', u('~\N{LATIN SMALL LETTER E WITH ACUTE}')]:
+            assert qs_encode(s) == quote_plus(s.encode('utf-8'))
+            if PY3:
+                # qs_encode takes no ``safe``; bytes go the same way as text.
+                assert qs_encode(s.encode('utf-8')) == quote_plus(s.encode('utf-8'))
@@ -15,4 +15,93 @@ if hasattr(urlparse, 'BaseResult') and not hasattr(urlparse, 'ResultMixin'):
     del _replace
 
 
-__all__ = ['urlparse']
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python < 3.2
+    def lru_cache(maxsize=128):
+        """
+        A minimal stand-in for ``functools.lru_cache``.
+
+        Only single, hashable positional arguments are supported. Rather than
+        tracking recency, the whole cache is dropped once it is full, which
+        is what ``urlparse`` itself does with its parse cache.
+        """
+        def decorator(func):
+            cache = {}
+
+            def wrapper(arg):
+                try:
+                    return cache[arg]
+                except KeyError:
+                    if len(cache) >= maxsize:
+                        cache.clear()
+                    result = cache[arg] = func(arg)
+                    return result
+            wrapper.cache_clear = cache.clear
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorator
+
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: the builtin ``intern()`` refuses unicode strings, which is
+    # what URL components are, so interning becomes a no-op.
+    def intern(s):
+        return s
+
+
+if hasattr(str, 'isascii'):
+    def isascii(s):
+        return s.isascii()
+else:
+    # Python < 3.7
+    def isascii(s):
+        try:
+            s.encode('ascii')
+        except UnicodeError:
+            return False
+        return True
+
+
+class cached_property(property):
+
+    """
+    A read-only property whose value is computed once and then stored on the
+    instance.
+
+    Unlike ``functools.cached_property`` (Python 3.8+), this takes no lock,
+    can't be assigned to, and doctests in its docstring are still collected.
+    """
+
+    def __init__(self, func):
+        super(cached_property, self).__init__(func)
+        self.attrname = func.__name__
+        # So doctest collects the docstring as part of the caller's module.
+        self.__module__ = func.__module__
+
+    def __set_name__(self, owner, name):
+        # Python 3.6+: use the mangled name for ``__private`` attributes.
+        self.attrname = name
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        try:
+            return cache[self.attrname]
+        except KeyError:
+            value = cache[self.attrname] = self.fget(instance)
+            return value
+
+    def __set__(self, instance, value):
+        raise AttributeError("can't set attribute")
+
+    def __delete__(self, instance):
+        raise AttributeError("can't delete attribute")
+
+
+__all__ = ['urlparse', 'lru_cache', 'intern', 'isascii', 'cached_property']
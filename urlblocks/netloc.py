@@ -1,8 +1,46 @@
-from .compat import urlparse
+from .compat import urlparse, lru_cache, intern
 from .six import text_type, u
 from .domain_levels import DOMAIN_LEVEL_SECOND, DOMAIN_LEVEL_LOWER
 
 
+#: Stands in for the port of a netloc whose port isn't a valid number.
+_BAD_PORT = object()
+
+
+@lru_cache(maxsize=256)
+def _split_netloc(netloc):
+    """
+    Parse ``netloc`` into a ``(username, password, hostname, port)`` tuple.
+
+    An invalid port is returned as ``_BAD_PORT`` rather than raising, so the
+    rest of the netloc is still usable; see :func:`_netloc_port`.
+    """
+    split = urlparse.SplitResult('', netloc, '', '', '')
+    hostname = split.hostname
+    if hostname is not None:
+        hostname = intern(hostname)
+    try:
+        port = split.port
+    except ValueError:
+        port = _BAD_PORT
+    return split.username, split.password, hostname, port
+
+
+@lru_cache(maxsize=256)
+def _split_domains(hostname):
+    """Split ``hostname`` into a tuple of its non-empty, dot-separated labels."""
+    return tuple(filter(len, hostname.split('.')))
+
+
+def _netloc_port(netloc):
+    """The port number of ``netloc``, raising ``ValueError`` if it's invalid."""
+    port = _split_netloc(netloc)[3]
+    if port is _BAD_PORT:
+        # Parse it again, just to raise urlparse's own error.
+        return urlparse.SplitResult('', netloc, '', '', '').port
+    return port
+
+
 class Netloc(text_type):
 
     """
@@ -12,6 +50,9 @@ class Netloc(text_type):
     components of the netloc. All methods return new instances.
     """
 
+    # Parsed components are memoized by ``_split_netloc``, not on instances.
+    __slots__ = ('__weakref__',)
+
     def __repr__(self):
         return u('Netloc(%r)') % (text_type(self),)
 
@@ -32,7 +73,7 @@ class Netloc(text_type):
     @property
     def username(self):
         """The username portion of this netloc, or ``None``."""
-        return self.__urlsplit.username
+        return _split_netloc(self)[0]
 
     def with_username(self, username):
         """Replace or add a username to this netloc."""
@@ -45,7 +86,7 @@ class Netloc(text_type):
     @property
     def password(self):
         """The password portion of this netloc, or ``None``."""
-        return self.__urlsplit.password
+        return _split_netloc(self)[1]
 
     def with_password(self, password):
 
@@ -82,7 +123,7 @@ class Netloc(text_type):
     @property
     def hostname(self):
         """The hostname portion of this netloc."""
-        return self.__urlsplit.hostname
+        return _split_netloc(self)[2]
 
     def with_hostname(self, hostname):
         """Replace the hostname on this netloc."""
@@ -91,7 +132,7 @@ class Netloc(text_type):
     @property
     def port(self):
         """The port number on this netloc (as an ``int``), or ``None``."""
-        return self.__urlsplit.port
+        return _netloc_port(self)
 
     def with_port(self, port):
         """Replace or add a port number to this netloc."""
@@ -107,10 +148,10 @@ class Netloc(text_type):
         Domains.
         """
 
-        return list(filter(len, self.hostname.split('.')))
+        return list(_split_domains(self.hostname))
 
     def get_domain(self, domain_level=DOMAIN_LEVEL_SECOND):
-        return self.domains[domain_level]
+        return _split_domains(self.hostname)[domain_level]
 
     def with_domain(self, domain, domain_level=DOMAIN_LEVEL_SECOND):
         domains = self.domains
@@ -120,7 +161,7 @@ class Netloc(text_type):
 
     @property
     def subdomain(self):
-        return self.domains[DOMAIN_LEVEL_LOWER]
+        return _split_domains(self.hostname)[DOMAIN_LEVEL_LOWER]
 
     def add_subdomain(self, subdomain):
         """Add a new subdomain to this netloc."""
@@ -132,10 +173,6 @@ class Netloc(text_type):
         del domains[DOMAIN_LEVEL_LOWER]
         return self.__replace(hostname='.'.join(domains))
 
-    @property
-    def __urlsplit(self):
-        return urlparse.SplitResult('', self, '', '', '')
-
     def __replace(self, **params):
         """Replace any number of components on this netloc."""
         unsplit_args = {'username': self.username,
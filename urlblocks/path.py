@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import posixpath
+import re
+import string
+import sys
 import urllib
 
-from .compat import urlparse
+from .compat import urlparse, isascii
 from .six import text_type, u
 
 
@@ -17,6 +20,8 @@ class Root(object):
 
 class URLPath(text_type):
 
+    __slots__ = ('__weakref__',)
+
     root = Root()
 
     def __repr__(self):
@@ -143,6 +148,52 @@ class URLPath(text_type):
         return type(self)(posixpath.join(self, path_encode(path, safe='/')))
 
 
+#: Characters which ``quote()`` never percent-encodes.
+_ALWAYS_SAFE = string.ascii_letters + string.digits + '_.-'
+if sys.version_info >= (3, 7):
+    # Earlier versions quote ``~`` as well (RFC 2396 rather than RFC 3986).
+    _ALWAYS_SAFE += '~'
+
+#: Compiled matchers for runs of characters needing no quoting, keyed by ``safe``.
+_safe_matchers = {}
+
+
+def _ascii_safe(safe):
+    """``safe`` as ``quote()`` reads it: as text, keeping only ASCII characters."""
+    if isinstance(safe, bytes):
+        safe = safe.decode('latin-1')
+    return ''.join(c for c in safe if c < '\x80')
+
+
+def _safe_prefix_length(s, safe=''):
+    """
+    The number of leading characters in ``s`` that ``quote()`` leaves alone.
+
+    Shared by the path and query string encoders.
+    """
+    try:
+        match = _safe_matchers[safe]
+    except KeyError:
+        pattern = '[%s]*' % re.escape(_ALWAYS_SAFE + _ascii_safe(safe))
+        match = _safe_matchers[safe] = re.compile(pattern).match
+    return match(s).end()
+
+
+#: ``str.translate()`` tables percent-encoding ASCII text, keyed by ``safe``.
+_quote_tables = {}
+
+
+def _quote_ascii(s, safe):
+    """Percent-encode the ASCII string ``s`` exactly as ``quote()`` would."""
+    try:
+        table = _quote_tables[safe]
+    except KeyError:
+        always_safe = _ALWAYS_SAFE + _ascii_safe(safe)
+        table = _quote_tables[safe] = dict(
+            (i, '%%%02X' % i) for i in range(128) if chr(i) not in always_safe)
+    return s.translate(table)
+
+
 def _path_encode_py2(s, safe=''):
     """Quote unicode or str using path rules."""
     if isinstance(s, unicode):
@@ -156,7 +207,20 @@ def _path_encode_py3(s, safe=''):
     """Quote str or bytes using path rules."""
     # s can be bytes or unicode, urllib.parse.quote() assumes
     # utf-8 if encoding is necessary.
-    return urlparse.quote(s, safe=safe)
+    if not isinstance(s, str):
+        return urlparse.quote(s, safe=safe)
+    start = _safe_prefix_length(s, safe)
+    if start == len(s):
+        # Nothing to quote, so skip the round trip through UTF-8 bytes.
+        return s
+    # The safe prefix is kept as it is; only the rest needs encoding.
+    rest = s[start:]
+    if isascii(rest):
+        # Every character is a single UTF-8 byte, so quoting is a lookup.
+        rest = _quote_ascii(rest, safe)
+    else:
+        rest = urlparse.quote(rest, safe=safe)
+    return s[:start] + rest
 
 
 def _path_decode_py2(s):
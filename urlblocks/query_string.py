@@ -3,11 +3,14 @@ import re
 import urllib
 
 from .compat import urlparse
+from .path import _safe_prefix_length
 from .six import text_type, string_types, u
 
 
 class QueryString(text_type):
 
+    __slots__ = ('__weakref__',)
+
     def __repr__(self):
         return u('QueryString(%r)') % (text_type(self),)
 
@@ -128,6 +131,10 @@ def _qs_encode_py3(s):
         s = str(s)
     # s can be bytes or unicode, urllib.parse.quote() assumes
     # utf-8 if encoding is necessary.
+    if isinstance(s, str) and _safe_prefix_length(s) == len(s):
+        # Plain names and values are common, and come back from quote_plus()
+        # unchanged anyway.
+        return s
     return urlparse.quote_plus(s)
 
 